@@ -6,6 +6,7 @@ Location: ~/.claude/state/{session_id}-{key}
 Operations:
 - get(session_id, key) -> str | None
 - set(session_id, key, value)
+- set_many(session_id, values)
 - clear(session_id, key)
 - exists(session_id, key) -> bool
 
@@ -15,6 +16,7 @@ No locking (session-scoped files).
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 
 STATE_DIR = Path.home() / ".claude" / "state"
@@ -60,6 +62,25 @@ def set(session_id: str, key: str, value: str) -> None:
     path.write_text(value, encoding="utf-8")
 
 
+def set_many(session_id: str, values: Mapping[str, str]) -> None:
+    """Set several state values for a session at once.
+
+    Creates state directory once, then writes each key.
+    Overwrites existing values.
+
+    Args:
+        session_id: Session identifier
+        values: Mapping of state keys to values
+
+    Raises:
+        PermissionError: If directory cannot be created or a file cannot be written
+    """
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    for key, value in values.items():
+        path = _get_state_path(session_id, key)
+        path.write_text(value, encoding="utf-8")
+
+
 def clear(session_id: str, key: str) -> None:
     """Clear state value for key.
 
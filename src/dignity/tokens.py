@@ -6,6 +6,7 @@ import hashlib
 import json
 import logging
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -96,13 +97,25 @@ def _parse_transcript(transcript_path: Path) -> TokenMetrics:
     Raises:
         Exception: If file cannot be read or parsed
     """
+    content = transcript_path.read_text(encoding="utf-8")
+    return _parse_transcript_lines(content.splitlines())
+
+
+def _parse_transcript_lines(lines: Iterable[str]) -> TokenMetrics:
+    """Calculate metrics from transcript JSONL lines.
+
+    Args:
+        lines: Lines of a transcript JSONL file
+
+    Returns:
+        TokenMetrics with aggregated usage data
+    """
     total_input = 0
     total_output = 0
     total_cached = 0
     messages_for_context: list[dict[str, int | str]] = []
 
-    content = transcript_path.read_text(encoding="utf-8")
-    for line in content.splitlines():
+    for line in lines:
         if not line.strip():
             continue
 
@@ -0,0 +1,24 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_TMPFS_ROOT = Path("/dev/shm")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Root pytest's temporary directories on tmpfs when available.
+
+    Every CLI test writes spec fixtures and has the CLI rewrite them, so
+    keeping ``tmp_path`` in memory avoids disk write-back. An explicit
+    ``--basetemp`` or ``PYTEST_DEBUG_TEMPROOT`` always wins.
+    """
+    if config.option.basetemp is not None or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    if sys.platform == "linux" and _TMPFS_ROOT.is_dir() and os.access(_TMPFS_ROOT, os.W_OK):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = str(_TMPFS_ROOT)
@@ -2,54 +2,60 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 from dignity import state
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def session_id() -> str:
     """Test session ID."""
     return "test-session-12345"
 
 
-@pytest.fixture
-def state_dir() -> Path:
-    """State directory for testing."""
-    return Path.home() / ".claude" / "state"
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the state backend at an isolated directory for each test."""
+    state_dir = tmp_path / "state"
+    monkeypatch.setattr(state, "STATE_DIR", state_dir)
+    return state_dir
 
 
-@pytest.fixture(autouse=True)
-def cleanup_test_state(session_id: str, state_dir: Path) -> None:
-    """Clean up test state files after each test."""
-    yield
-    if state_dir.exists():
-        for file in state_dir.glob(f"{session_id}-*"):
-            file.unlink(missing_ok=True)
+@dataclass(frozen=True)
+class StateTestCase:
+    """Round-trip case: values written to one key, where None means clear()."""
 
+    writes: tuple[str | None, ...]
+    expected: str | None
+    description: str
 
-# state.get tests
 
+STATE_CASES = [
+    StateTestCase(writes=(), expected=None, description="nonexistent key"),
+    StateTestCase(writes=("test-value",), expected="test-value", description="existing key"),
+    StateTestCase(writes=("",), expected="", description="empty value"),
+    StateTestCase(writes=("old-value", "new-value"), expected="new-value", description="overwrites existing"),
+    StateTestCase(writes=("line1\nline2\nline3",), expected="line1\nline2\nline3", description="multiline value"),
+    StateTestCase(writes=("temp-value", None), expected=None, description="cleared key"),
+]
 
-def test_state_get_nonexistent_key(session_id: str) -> None:
-    """get() returns None for nonexistent key."""
-    result = state.get(session_id, "nonexistent")
-    assert result is None
 
+# state.get / state.exists round-trip tests
 
-def test_state_get_existing_key(session_id: str) -> None:
-    """get() returns value for existing key."""
-    state.set(session_id, "test-key", "test-value")
-    result = state.get(session_id, "test-key")
-    assert result == "test-value"
 
+@pytest.mark.parametrize("case", STATE_CASES, ids=lambda c: c.description)
+def test_state_roundtrip(case: StateTestCase, session_id: str) -> None:
+    """get() and exists() reflect the last set() or clear() of a key."""
+    for value in case.writes:
+        if value is None:
+            state.clear(session_id, "test-key")
+        else:
+            state.set(session_id, "test-key", value)
 
-def test_state_get_empty_value(session_id: str) -> None:
-    """get() returns empty string for empty value."""
-    state.set(session_id, "empty-key", "")
-    result = state.get(session_id, "empty-key")
-    assert result == ""
+    assert state.get(session_id, "test-key") == case.expected
+    assert state.exists(session_id, "test-key") is (case.expected is not None)
 
 
 # state.set tests
@@ -62,38 +68,39 @@ def test_state_set_creates_file(session_id: str, state_dir: Path) -> None:
     assert file_path.exists()
 
 
-def test_state_set_writes_content(session_id: str) -> None:
-    """set() writes value to file."""
-    state.set(session_id, "content-key", "content-value")
-    result = state.get(session_id, "content-key")
-    assert result == "content-value"
+def test_state_set_creates_directory_if_missing(session_id: str, state_dir: Path) -> None:
+    """set() creates state directory if it doesn't exist."""
+    assert not state_dir.exists()
 
+    state.set(session_id, "test-key", "test-value")
+    assert state_dir.exists()
+    assert state_dir.is_dir()
 
-def test_state_set_overwrites_existing(session_id: str) -> None:
-    """set() overwrites existing value."""
-    state.set(session_id, "overwrite-key", "old-value")
-    state.set(session_id, "overwrite-key", "new-value")
-    result = state.get(session_id, "overwrite-key")
-    assert result == "new-value"
 
+# state.set_many tests
 
-def test_state_set_multiline_value(session_id: str) -> None:
-    """set() handles multiline values."""
-    multiline = "line1\nline2\nline3"
-    state.set(session_id, "multiline-key", multiline)
-    result = state.get(session_id, "multiline-key")
-    assert result == multiline
 
+def test_state_set_many_writes_all_keys(session_id: str) -> None:
+    """set_many() writes every key in the mapping."""
+    state.set_many(session_id, {"first-key": "first-value", "second-key": "second-value"})
+    assert state.get(session_id, "first-key") == "first-value"
+    assert state.get(session_id, "second-key") == "second-value"
 
-def test_state_set_creates_directory_if_missing(session_id: str, state_dir: Path) -> None:
-    """set() creates state directory if it doesn't exist."""
-    if state_dir.exists():
-        for file in state_dir.glob("*"):
-            file.unlink()
-        state_dir.rmdir()
 
-    state.set(session_id, "test-key", "test-value")
-    assert state_dir.exists()
+def test_state_set_many_overwrites_existing(session_id: str) -> None:
+    """set_many() overwrites existing values and leaves other keys alone."""
+    state.set(session_id, "overwrite-key", "old-value")
+    state.set(session_id, "other-key", "other-value")
+    state.set_many(session_id, {"overwrite-key": "new-value"})
+    assert state.get(session_id, "overwrite-key") == "new-value"
+    assert state.get(session_id, "other-key") == "other-value"
+
+
+def test_state_set_many_creates_directory_if_missing(session_id: str, state_dir: Path) -> None:
+    """set_many() creates state directory if it doesn't exist."""
+    assert not state_dir.exists()
+
+    state.set_many(session_id, {"test-key": "test-value"})
     assert state_dir.is_dir()
 
 
@@ -114,59 +121,19 @@ def test_state_clear_nonexistent_key(session_id: str) -> None:
     state.clear(session_id, "nonexistent-key")
 
 
-def test_state_clear_makes_get_return_none(session_id: str) -> None:
-    """clear() makes get() return None."""
-    state.set(session_id, "temp-key", "temp-value")
-    state.clear(session_id, "temp-key")
-    result = state.get(session_id, "temp-key")
-    assert result is None
-
-
-# state.exists tests
-
-
-def test_state_exists_for_existing_key(session_id: str) -> None:
-    """exists() returns True for existing key."""
-    state.set(session_id, "exists-key", "exists-value")
-    assert state.exists(session_id, "exists-key") is True
-
-
-def test_state_exists_for_nonexistent_key(session_id: str) -> None:
-    """exists() returns False for nonexistent key."""
-    assert state.exists(session_id, "nonexistent-key") is False
-
-
-def test_state_exists_after_clear(session_id: str) -> None:
-    """exists() returns False after clear()."""
-    state.set(session_id, "temp-key", "temp-value")
-    state.clear(session_id, "temp-key")
-    assert state.exists(session_id, "temp-key") is False
-
-
-def test_state_exists_for_empty_value(session_id: str) -> None:
-    """exists() returns True for empty value."""
-    state.set(session_id, "empty-key", "")
-    assert state.exists(session_id, "empty-key") is True
-
-
 # Permission and error handling tests
 
 
-def test_state_fails_on_permission_error(session_id: str, state_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_state_fails_on_permission_error(session_id: str, monkeypatch: pytest.MonkeyPatch) -> None:
     """set() raises on permission error."""
-    original_mode = state_dir.stat().st_mode if state_dir.exists() else None
 
-    try:
-        state_dir.mkdir(parents=True, exist_ok=True)
-        state_dir.chmod(0o444)
+    def deny_write(*args: object, **kwargs: object) -> None:
+        raise PermissionError("Permission denied")
 
-        with pytest.raises(PermissionError):
-            state.set(session_id, "perm-key", "perm-value")
-    finally:
-        if original_mode:
-            state_dir.chmod(original_mode)
-        else:
-            state_dir.chmod(0o755)
+    monkeypatch.setattr(Path, "write_text", deny_write)
+
+    with pytest.raises(PermissionError):
+        state.set(session_id, "perm-key", "perm-value")
 
 
 # Session isolation tests
@@ -182,6 +149,3 @@ def test_state_different_sessions_isolated() -> None:
 
     assert state.get(session1, "shared-key") == "value-1"
     assert state.get(session2, "shared-key") == "value-2"
-
-    state.clear(session1, "shared-key")
-    state.clear(session2, "shared-key")
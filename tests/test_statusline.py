@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -10,96 +12,121 @@ import dignity.statusline as statusline_module
 from dignity.statusline import StatusLineInput, render_statusline
 
 
-def test_render_statusline_with_git_branch(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Test status line rendering with git branch."""
-
-    # Mock get_git_branch to return "main"
-    def mock_get_git_branch(directory: Path) -> str | None:
-        return "main"
+@dataclass(frozen=True)
+class RenderTestCase:
+    """Test case for status line rendering with a mocked git branch."""
 
-    monkeypatch.setattr(statusline_module, "get_git_branch", mock_get_git_branch)
+    model_name: str
+    dir_name: str
+    branch: str | None
+    transcript_content: str
+    max_tokens: int
+    expected: str
+    description: str
 
-    # Create empty transcript (will result in 0 tokens)
-    transcript_path = tmp_path / "transcript.jsonl"
-    transcript_path.write_text("", encoding="utf-8")
 
-    input_data = StatusLineInput(
+RENDER_CASES = [
+    RenderTestCase(
         model_name="Sonnet 4.5",
-        current_dir=str(tmp_path / "dignity"),
-        transcript_path=str(transcript_path),
+        dir_name="myproject",
+        branch="feature-branch",
+        transcript_content='{"message": {"usage": {"input_tokens": 50000, "output_tokens": 10000}}, "timestamp": "2024-01-01T00:00:00"}',
         max_tokens=200000,
-    )
-
-    result = render_statusline(input_data)
-
-    assert result == "Sonnet 4.5 | dignity | main | 0/200000 (0%)"
-
-
-def test_render_statusline_without_git_branch(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        expected="Sonnet 4.5 | myproject | feature-branch | 50000/200000 (25%)",
+        description="with tokens",
+    ),
+    RenderTestCase(
+        model_name="Test Model",
+        dir_name="test",
+        branch="main",
+        # 33333 / 100000 = 33.333% -> rounds to 33%
+        transcript_content='{"message": {"usage": {"input_tokens": 33333, "output_tokens": 5000}}, "timestamp": "2024-01-01T00:00:00"}',
+        max_tokens=100000,
+        expected="Test Model | test | main | 33333/100000 (33%)",
+        description="percentage calculation",
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def empty_transcript(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Empty transcript file shared by tests that expect 0 tokens."""
+    transcript_path = tmp_path_factory.mktemp("transcripts") / "empty.jsonl"
+    transcript_path.touch()
+    return transcript_path
+
+
+@pytest.fixture
+def mock_branch(monkeypatch: pytest.MonkeyPatch) -> Callable[[str | None], None]:
+    """Return a setter that makes get_git_branch report the given branch."""
+
+    def set_branch(branch: str | None) -> None:
+        monkeypatch.setattr(statusline_module, "get_git_branch", lambda directory: branch)
+
+    return set_branch
+
+
+@pytest.mark.parametrize(
+    ("branch", "expected"),
+    [
+        ("main", "Sonnet 4.5 | dignity | main | 0/200000 (0%)"),
+        (None, "Sonnet 4.5 | dignity | 0/200000 (0%)"),
+    ],
+    ids=["with git branch", "without git branch"],
+)
+def test_render_statusline_empty_transcript(
+    branch: str | None,
+    expected: str,
+    tmp_path: Path,
+    empty_transcript: Path,
+    mock_branch: Callable[[str | None], None],
 ) -> None:
-    """Test status line rendering without git branch."""
-
-    def mock_get_git_branch(directory: Path) -> str | None:
-        return None
-
-    monkeypatch.setattr(statusline_module, "get_git_branch", mock_get_git_branch)
-
-    # Create empty transcript
-    transcript_path = tmp_path / "transcript.jsonl"
-    transcript_path.write_text("", encoding="utf-8")
+    """Test status line rendering with and without a branch for an empty transcript."""
+    mock_branch(branch)
 
     input_data = StatusLineInput(
         model_name="Sonnet 4.5",
         current_dir=str(tmp_path / "dignity"),
-        transcript_path=str(transcript_path),
+        transcript_path=str(empty_transcript),
         max_tokens=200000,
     )
 
     result = render_statusline(input_data)
 
-    assert result == "Sonnet 4.5 | dignity | 0/200000 (0%)"
+    # Empty transcript results in 0 tokens
+    assert result == expected
 
 
-def test_render_statusline_with_tokens(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+@pytest.mark.parametrize("case", RENDER_CASES, ids=lambda c: c.description)
+def test_render_statusline(
+    case: RenderTestCase,
+    tmp_path: Path,
+    mock_branch: Callable[[str | None], None],
 ) -> None:
-    """Test status line rendering with non-zero tokens."""
-
-    def mock_get_git_branch(directory: Path) -> str | None:
-        return "feature-branch"
+    """Test status line rendering for various token counts."""
+    mock_branch(case.branch)
 
-    monkeypatch.setattr(statusline_module, "get_git_branch", mock_get_git_branch)
-
-    # Create transcript with token data
     transcript_path = tmp_path / "transcript.jsonl"
-    transcript_content = '{"message": {"usage": {"input_tokens": 50000, "output_tokens": 10000}}, "timestamp": "2024-01-01T00:00:00"}'
-    transcript_path.write_text(transcript_content, encoding="utf-8")
+    transcript_path.write_text(case.transcript_content, encoding="utf-8")
 
     input_data = StatusLineInput(
-        model_name="Sonnet 4.5",
-        current_dir=str(tmp_path / "myproject"),
+        model_name=case.model_name,
+        current_dir=str(tmp_path / case.dir_name),
         transcript_path=str(transcript_path),
-        max_tokens=200000,
+        max_tokens=case.max_tokens,
     )
 
     result = render_statusline(input_data)
 
-    assert result == "Sonnet 4.5 | myproject | feature-branch | 50000/200000 (25%)"
+    assert result == case.expected
 
 
-def test_render_statusline_empty_current_dir(tmp_path: Path) -> None:
+def test_render_statusline_empty_current_dir(empty_transcript: Path) -> None:
     """Test status line rendering with empty current directory."""
-    # Create empty transcript
-    transcript_path = tmp_path / "transcript.jsonl"
-    transcript_path.write_text("", encoding="utf-8")
-
     input_data = StatusLineInput(
         model_name="Claude 3",
         current_dir="",
-        transcript_path=str(transcript_path),
+        transcript_path=str(empty_transcript),
         max_tokens=100000,
     )
 
@@ -109,14 +136,10 @@ def test_render_statusline_empty_current_dir(tmp_path: Path) -> None:
 
 
 def test_render_statusline_nonexistent_transcript(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, mock_branch: Callable[[str | None], None]
 ) -> None:
     """Test status line rendering with nonexistent transcript file."""
-
-    def mock_get_git_branch(directory: Path) -> str | None:
-        return "develop"
-
-    monkeypatch.setattr(statusline_module, "get_git_branch", mock_get_git_branch)
+    mock_branch("develop")
 
     input_data = StatusLineInput(
         model_name="GPT-4",
@@ -129,31 +152,3 @@ def test_render_statusline_nonexistent_transcript(
 
     # Should handle nonexistent file gracefully with 0 tokens
     assert result == "GPT-4 | project | develop | 0/150000 (0%)"
-
-
-def test_render_statusline_percentage_calculation(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Test that percentage is calculated and rounded correctly."""
-
-    def mock_get_git_branch(directory: Path) -> str | None:
-        return "main"
-
-    monkeypatch.setattr(statusline_module, "get_git_branch", mock_get_git_branch)
-
-    # Create transcript with specific token count for percentage test
-    transcript_path = tmp_path / "transcript.jsonl"
-    # 33333 / 100000 = 33.333% -> rounds to 33%
-    transcript_content = '{"message": {"usage": {"input_tokens": 33333, "output_tokens": 5000}}, "timestamp": "2024-01-01T00:00:00"}'
-    transcript_path.write_text(transcript_content, encoding="utf-8")
-
-    input_data = StatusLineInput(
-        model_name="Test Model",
-        current_dir=str(tmp_path / "test"),
-        transcript_path=str(transcript_path),
-        max_tokens=100000,
-    )
-
-    result = render_statusline(input_data)
-
-    assert result == "Test Model | test | main | 33333/100000 (33%)"
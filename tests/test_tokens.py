@@ -6,21 +6,37 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
-from dignity.tokens import TokenMetrics, get_token_metrics
+from dignity.tokens import TokenMetrics, _parse_transcript_lines, get_token_metrics
 
 
 @dataclass(frozen=True)
 class TranscriptTestCase:
     """Test case for token metrics calculation."""
 
-    content: str
+    lines: tuple[str, ...]
     expected: TokenMetrics
     description: str
 
 
+MULTIPLE_MESSAGES_WITH_CACHE_CASE = TranscriptTestCase(
+    lines=(
+        '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50, "cache_read_input_tokens": 300}}, "timestamp": "2024-01-01T00:00:00"}',
+        '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75, "cache_read_input_tokens": 500}}, "timestamp": "2024-01-01T00:01:00"}',
+    ),
+    expected=TokenMetrics(
+        input_tokens=300,
+        output_tokens=125,
+        cached_tokens=800,
+        total_tokens=1225,
+        context_length=700,  # Most recent: 200 + 500
+    ),
+    description="multiple messages with cache",
+)
+
+
 TRANSCRIPT_CASES = [
     TranscriptTestCase(
-        content="",
+        lines=(),
         expected=TokenMetrics(
             input_tokens=0,
             output_tokens=0,
@@ -31,7 +47,7 @@ TRANSCRIPT_CASES = [
         description="empty file",
     ),
     TranscriptTestCase(
-        content='{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
+        lines=('{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',),
         expected=TokenMetrics(
             input_tokens=100,
             output_tokens=50,
@@ -42,7 +58,7 @@ TRANSCRIPT_CASES = [
         description="single message without cache",
     ),
     TranscriptTestCase(
-        content='{"message": {"usage": {"input_tokens": 100, "output_tokens": 50, "cache_read_input_tokens": 200, "cache_creation_input_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
+        lines=('{"message": {"usage": {"input_tokens": 100, "output_tokens": 50, "cache_read_input_tokens": 200, "cache_creation_input_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',),
         expected=TokenMetrics(
             input_tokens=100,
             output_tokens=50,
@@ -53,11 +69,9 @@ TRANSCRIPT_CASES = [
         description="single message with cache",
     ),
     TranscriptTestCase(
-        content="\n".join(
-            [
-                '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
-                '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75}}, "timestamp": "2024-01-01T00:01:00"}',
-            ]
+        lines=(
+            '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
+            '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75}}, "timestamp": "2024-01-01T00:01:00"}',
         ),
         expected=TokenMetrics(
             input_tokens=300,
@@ -68,28 +82,11 @@ TRANSCRIPT_CASES = [
         ),
         description="multiple messages - uses most recent for context",
     ),
+    MULTIPLE_MESSAGES_WITH_CACHE_CASE,
     TranscriptTestCase(
-        content="\n".join(
-            [
-                '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50, "cache_read_input_tokens": 300}}, "timestamp": "2024-01-01T00:00:00"}',
-                '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75, "cache_read_input_tokens": 500}}, "timestamp": "2024-01-01T00:01:00"}',
-            ]
-        ),
-        expected=TokenMetrics(
-            input_tokens=300,
-            output_tokens=125,
-            cached_tokens=800,
-            total_tokens=1225,
-            context_length=700,  # Most recent: 200 + 500
-        ),
-        description="multiple messages with cache",
-    ),
-    TranscriptTestCase(
-        content="\n".join(
-            [
-                '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
-                '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75}}, "timestamp": "2024-01-01T00:01:00", "isSidechain": true}',
-            ]
+        lines=(
+            '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
+            '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75}}, "timestamp": "2024-01-01T00:01:00", "isSidechain": true}',
         ),
         expected=TokenMetrics(
             input_tokens=300,
@@ -101,11 +98,9 @@ TRANSCRIPT_CASES = [
         description="sidechain message excluded from context",
     ),
     TranscriptTestCase(
-        content="\n".join(
-            [
-                '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
-                '{"message": {"usage": {"input_tokens": 0, "output_tokens": 0}}, "timestamp": "2024-01-01T00:01:00", "isApiErrorMessage": true}',
-            ]
+        lines=(
+            '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
+            '{"message": {"usage": {"input_tokens": 0, "output_tokens": 0}}, "timestamp": "2024-01-01T00:01:00", "isApiErrorMessage": true}',
         ),
         expected=TokenMetrics(
             input_tokens=100,
@@ -117,12 +112,10 @@ TRANSCRIPT_CASES = [
         description="API error message excluded from context",
     ),
     TranscriptTestCase(
-        content="\n".join(
-            [
-                '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
-                "invalid json line",
-                '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75}}, "timestamp": "2024-01-01T00:01:00"}',
-            ]
+        lines=(
+            '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50}}, "timestamp": "2024-01-01T00:00:00"}',
+            "invalid json line",
+            '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75}}, "timestamp": "2024-01-01T00:01:00"}',
         ),
         expected=TokenMetrics(
             input_tokens=300,
@@ -134,11 +127,9 @@ TRANSCRIPT_CASES = [
         description="invalid JSON lines skipped",
     ),
     TranscriptTestCase(
-        content="\n".join(
-            [
-                '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50, "cache_creation_input_tokens": 25}}, "timestamp": "2024-01-01T00:00:00"}',
-                '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75, "cache_read_input_tokens": 150}}, "timestamp": "2024-01-01T00:01:00"}',
-            ]
+        lines=(
+            '{"message": {"usage": {"input_tokens": 100, "output_tokens": 50, "cache_creation_input_tokens": 25}}, "timestamp": "2024-01-01T00:00:00"}',
+            '{"message": {"usage": {"input_tokens": 200, "output_tokens": 75, "cache_read_input_tokens": 150}}, "timestamp": "2024-01-01T00:01:00"}',
         ),
         expected=TokenMetrics(
             input_tokens=300,
@@ -153,14 +144,23 @@ TRANSCRIPT_CASES = [
 
 
 @pytest.mark.parametrize("case", TRANSCRIPT_CASES, ids=lambda c: c.description)
-def test_get_token_metrics(case: TranscriptTestCase, tmp_path: Path) -> None:
+def test_parse_transcript_lines(case: TranscriptTestCase) -> None:
     """Test token metrics calculation from various transcript formats."""
+    result = _parse_transcript_lines(case.lines)
+
+    assert result == case.expected
+
+
+def test_get_token_metrics_reads_transcript_file(tmp_path: Path) -> None:
+    """Test that metrics are read from a transcript file on disk."""
     transcript_path = tmp_path / "transcript.jsonl"
-    transcript_path.write_text(case.content, encoding="utf-8")
+    transcript_path.write_text(
+        "\n".join(MULTIPLE_MESSAGES_WITH_CACHE_CASE.lines), encoding="utf-8"
+    )
 
     result = get_token_metrics(transcript_path)
 
-    assert result == case.expected
+    assert result == MULTIPLE_MESSAGES_WITH_CACHE_CASE.expected
 
 
 def test_get_token_metrics_nonexistent_file(tmp_path: Path) -> None:
@@ -178,7 +178,7 @@ def test_get_token_metrics_nonexistent_file(tmp_path: Path) -> None:
     )
 
 
-def test_get_token_metrics_message_without_timestamp() -> None:
+def test_get_token_metrics_message_without_timestamp(tmp_path: Path) -> None:
     """Test that messages without timestamps are excluded from context calculation."""
     content = "\n".join(
         [
@@ -187,21 +187,18 @@ def test_get_token_metrics_message_without_timestamp() -> None:
         ]
     )
 
-    transcript_path = Path("test_transcript.jsonl")
-    try:
-        transcript_path.write_text(content, encoding="utf-8")
-        result = get_token_metrics(transcript_path)
+    transcript_path = tmp_path / "transcript.jsonl"
+    transcript_path.write_text(content, encoding="utf-8")
+
+    result = get_token_metrics(transcript_path)
 
-        assert result.input_tokens == 300
-        assert result.output_tokens == 125
-        assert result.total_tokens == 425
-        assert result.context_length == 100  # Uses timestamped message
-    finally:
-        if transcript_path.exists():
-            transcript_path.unlink()
+    assert result.input_tokens == 300
+    assert result.output_tokens == 125
+    assert result.total_tokens == 425
+    assert result.context_length == 100  # Uses timestamped message
 
 
-def test_get_token_metrics_ordering() -> None:
+def test_get_token_metrics_ordering(tmp_path: Path) -> None:
     """Test that context is calculated from truly most recent message by timestamp."""
     content = "\n".join(
         [
@@ -211,14 +208,11 @@ def test_get_token_metrics_ordering() -> None:
         ]
     )
 
-    transcript_path = Path("test_transcript.jsonl")
-    try:
-        transcript_path.write_text(content, encoding="utf-8")
-        result = get_token_metrics(transcript_path)
-
-        assert result.input_tokens == 600
-        assert result.output_tokens == 225
-        assert result.context_length == 300  # Most recent by timestamp, not file order
-    finally:
-        if transcript_path.exists():
-            transcript_path.unlink()
+    transcript_path = tmp_path / "transcript.jsonl"
+    transcript_path.write_text(content, encoding="utf-8")
+
+    result = get_token_metrics(transcript_path)
+
+    assert result.input_tokens == 600
+    assert result.output_tokens == 225
+    assert result.context_length == 300  # Most recent by timestamp, not file order